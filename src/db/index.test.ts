@@ -2,7 +2,7 @@
  * Tests for index module - SmithersDB factory and integration
  */
 
-import { describe, test, expect, afterEach } from 'bun:test'
+import { describe, test, expect, afterEach, spyOn } from 'bun:test'
 import { createSmithersDB, type SmithersDB, ReactiveDatabase } from './index.js'
 
 describe('createSmithersDB', () => {
@@ -123,6 +123,49 @@ describe('createSmithersDB', () => {
       db = createSmithersDB()
       expect(db).toBeDefined()
     })
+
+    test('runMigrations replaces idx_transitions_key with idx_transitions_key_created', () => {
+      const testPath = '/tmp/test-smithers-db-transitions-' + Date.now() + '.sqlite'
+      const legacy = new ReactiveDatabase(testPath)
+      legacy.exec(`
+        CREATE TABLE transitions (
+          id TEXT PRIMARY KEY,
+          execution_id TEXT,
+          key TEXT NOT NULL,
+          old_value TEXT,
+          new_value TEXT NOT NULL,
+          trigger TEXT,
+          trigger_agent_id TEXT,
+          created_at TEXT DEFAULT (datetime('now'))
+        );
+        CREATE INDEX idx_transitions_key ON transitions(key);
+      `)
+      legacy.close()
+
+      try {
+        db = createSmithersDB({ path: testPath })
+        const indexes = db
+          .query<{ name: string }>("SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'transitions'")
+          .map(row => row.name)
+        expect(indexes).toContain('idx_transitions_key_created')
+        expect(indexes).not.toContain('idx_transitions_key')
+
+        const querySpy = spyOn(db.db, 'query')
+        db.state.history('counter')
+        const [historySql, historyParams] = querySpy.mock.calls[0]!
+        querySpy.mockRestore()
+
+        const plan = db.query<{ detail: string }>(`EXPLAIN QUERY PLAN ${historySql}`, historyParams)
+        const details = plan.map(row => row.detail).join('\n')
+        expect(details).toContain('idx_transitions_key_created')
+        expect(details).not.toContain('TEMP B-TREE')
+      } finally {
+        db?.close()
+        db = null
+        const { unlinkSync } = require('fs')
+        try { unlinkSync(testPath) } catch {}
+      }
+    })
   })
 
   describe('Reset behavior', () => {
@@ -87,6 +87,9 @@ const TABLE_MIGRATIONS: TableMigration[] = [
 
 const STANDALONE_INDEXES = ['CREATE INDEX IF NOT EXISTS idx_tasks_scope ON tasks(scope_id)']
 
+// Indexes superseded by newer ones in schema.sql
+const DROPPED_INDEXES = ['idx_transitions_key']
+
 function runMigrations(rdb: ReactiveDatabase): void {
   const columnCache = new Map<string, Set<string>>()
   const getColumns = (table: string) => {
@@ -112,6 +115,7 @@ function runMigrations(rdb: ReactiveDatabase): void {
   }
 
   STANDALONE_INDEXES.forEach((idx) => rdb.exec(idx))
+  DROPPED_INDEXES.forEach((name) => rdb.exec(`DROP INDEX IF EXISTS ${name}`))
 }
 
 export function createSmithersDB(options: SmithersDBOptions = {}): SmithersDB {
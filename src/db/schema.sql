@@ -229,7 +229,7 @@ CREATE TABLE IF NOT EXISTS transitions (
 );
 
 CREATE INDEX IF NOT EXISTS idx_transitions_execution ON transitions(execution_id);
-CREATE INDEX IF NOT EXISTS idx_transitions_key ON transitions(key);
+CREATE INDEX IF NOT EXISTS idx_transitions_key_created ON transitions(key, created_at DESC);
 CREATE INDEX IF NOT EXISTS idx_transitions_created ON transitions(created_at DESC);
 
 -- 8. BUILD STATE - Broken Build Orchestration Coordination
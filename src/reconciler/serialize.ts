@@ -138,16 +138,16 @@ function containsFunctions(value: unknown, seen = new WeakSet()): boolean {
   return Object.values(value as Record<string, unknown>).some(v => containsFunctions(v, seen))
 }
 
-function serializeProps(props: Record<string, unknown>): string {
-  const nonSerializable = new Set([
-    'children', 'onFinished', 'onError', 'onStart', 'onComplete', 'onIteration',
-    'onProgress', 'onStreamStart', 'onStreamDelta', 'onStreamEnd', 'onStreamPart',
-    'onToolCall', 'onReady', 'onApprove', 'onReject', 'validate', 'middleware',
-    'key', '__smithersKey', 'ref',
-  ])
+const NON_SERIALIZABLE_PROPS = new Set([
+  'children', 'onFinished', 'onError', 'onStart', 'onComplete', 'onIteration',
+  'onProgress', 'onStreamStart', 'onStreamDelta', 'onStreamEnd', 'onStreamPart',
+  'onToolCall', 'onReady', 'onApprove', 'onReject', 'validate', 'middleware',
+  'key', '__smithersKey', 'ref',
+])
 
+function serializeProps(props: Record<string, unknown>): string {
   return Object.entries(props)
-    .filter(([key]) => !nonSerializable.has(key))
+    .filter(([key]) => !NON_SERIALIZABLE_PROPS.has(key))
     .filter(([, value]) => value !== undefined && value !== null)
     .filter(([, value]) => !containsFunctions(value))
     .map(([key, value]) => {
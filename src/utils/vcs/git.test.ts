@@ -57,11 +57,17 @@ describe('git utilities', () => {
   describe('getCommitInfo()', () => {
     test('returns commit info with hash, author, message', async () => {
       const info = await getCommitInfo('HEAD', testDir)
-      expect(info.hash).toMatch(/^[a-f0-9]{40}$/)
-      expect(typeof info.author).toBe('string')
-      expect(info.author.length).toBeGreaterThan(0)
-      expect(typeof info.message).toBe('string')
-      expect(info.message.length).toBeGreaterThan(0)
+      expect(info.hash).toBe(await getCommitHash('HEAD', testDir))
+      expect(info.author).toBe('Test User')
+      expect(info.message).toBe('Initial commit')
+    })
+
+    test('matches getCommitHash for annotated tags', async () => {
+      await Bun.$`git tag -a v-info -m "Tag message"`.cwd(testDir).quiet()
+      const info = await getCommitInfo('v-info', testDir)
+      expect(info.hash).toBe(await getCommitHash('v-info', testDir))
+      expect(info.author).toBe('Test User')
+      expect(info.message).toBe('Initial commit')
     })
   })
 
@@ -52,9 +52,11 @@ export async function getCommitHash(ref: string = 'HEAD', cwd?: string): Promise
 
 export async function getCommitInfo(ref: string = 'HEAD', cwd?: string): Promise<CommitInfo> {
   try {
-    const hash = await withCwd(Bun.$`git rev-parse ${ref}`, cwd).text()
-    const author = await withCwd(Bun.$`git log -1 --format=%an ${ref}`, cwd).text()
-    const message = await withCwd(Bun.$`git log -1 --format=%s ${ref}`, cwd).text()
+    const [hash, details] = await Promise.all([
+      withCwd(Bun.$`git rev-parse ${ref}`, cwd).text(),
+      withCwd(Bun.$`git log -1 --format=%an%n%s ${ref} --`, cwd).text(),
+    ])
+    const [author = '', message = ''] = details.split('\n')
     return {
       hash: hash.trim(),
       author: author.trim(),